@@ -0,0 +1,58 @@
+# src/dk_browser.py
+# Browser setup shared by the DraftKings scrapers (fav_edges, scrape_props):
+# Chromium flags, heavy-resource blocking, and a small pool of contexts.
+
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable, List
+
+MAX_PARALLEL_PAGES = 3  # events scraped concurrently, one browser context each
+
+# We only read text; skip the megabytes of images/fonts/CSS on every DK page.
+BLOCKED_RESOURCES = {"image", "font", "media", "stylesheet"}
+BLOCKED_HOSTS = ("google-analytics", "googletagmanager", "doubleclick")
+# Chromium flags: /dev/shm is tiny on CI runners; images are never needed
+LAUNCH_ARGS = ["--no-sandbox", "--disable-dev-shm-usage", "--blink-settings=imagesEnabled=false"]
+
+async def block_heavy(route) -> None:
+    req = route.request
+    if req.resource_type in BLOCKED_RESOURCES or any(h in req.url for h in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def new_context(browser, nav_timeout: int, **options):
+    """Browser context for DK pages: no service workers, no heavy resources."""
+    context = await browser.new_context(
+        service_workers="block",  # SW-served requests would bypass the route below
+        **options,
+    )
+    context.set_default_navigation_timeout(nav_timeout)
+    await context.route("**/*", block_heavy)
+    return context
+
+async def open_contexts(browser, nav_timeout: int, **options) -> list:
+    """MAX_PARALLEL_PAGES contexts; separate contexts get separate renderer processes."""
+    return [await new_context(browser, nav_timeout, **options) for _ in range(MAX_PARALLEL_PAGES)]
+
+async def run_pooled(contexts: list, fn: Callable[[Any, Any], Awaitable[Any]],
+                     items: Iterable[Any], timeout: float) -> List[Any]:
+    """
+    Run fn(context, item) for every item, each on a context taken from the pool,
+    so at most len(contexts) run at once. Results come back in item order with
+    exceptions in place; an item still running after `timeout` seconds is
+    cancelled and yields TimeoutError.
+    """
+    pool: asyncio.Queue = asyncio.Queue()
+    for ctx in contexts:
+        pool.put_nowait(ctx)
+
+    async def one(item):
+        ctx = await pool.get()
+        try:
+            # The clock starts once a context is free, so queued items aren't penalised
+            async with asyncio.timeout(timeout):
+                return await fn(ctx, item)
+        finally:
+            pool.put_nowait(ctx)
+
+    return await asyncio.gather(*(one(item) for item in items), return_exceptions=True)
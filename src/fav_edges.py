@@ -2,35 +2,58 @@
 # DraftKings-only Favorites + Coin-Flip bot.
 # Per game: 2 favorites + 1 coin-flip with True vs Book vs Edge.
 
-import os, re, math, asyncio, requests, pytz
+import os, re, math, asyncio
 from datetime import datetime
+from zoneinfo import ZoneInfo
 from playwright.async_api import async_playwright, TimeoutError as PWTimeout
 from kickoff_gate import should_run_now
+from http_session import session
+from dk_browser import LAUNCH_ARGS, open_contexts, run_pooled
 
 # --- Telegram ---
 BOT = os.getenv("TELEGRAM_BOT_TOKEN") or os.getenv("TELEGRAM_BOTFOOTBALL_TOKEN")
 CHAT = os.getenv("TELEGRAM_CHAT_ID")
+SEND_TIMEOUT = 15  # s, per Telegram POST
 def tg_send(text: str, silent: bool = False):
     if not (BOT and CHAT): 
         print("Telegram not configured"); 
         return None
     url = f"https://api.telegram.org/bot{BOT}/sendMessage"
-    r = requests.post(url, json={"chat_id": CHAT, "text": text, "parse_mode":"HTML", "disable_notification": bool(silent)}, timeout=15)
+    r = session().post(url, json={"chat_id": CHAT, "text": text, "parse_mode":"HTML", "disable_notification": bool(silent)}, timeout=SEND_TIMEOUT)
     try:
         return r.json().get("result", {}).get("message_id")
     except Exception:
         return None
+async def tg_send_async(text: str, silent: bool = False):
+    # requests blocks; run it off the event loop so concurrent scrapes keep going
+    return await asyncio.to_thread(tg_send, text, silent)
 def tg_pin(message_id: int):
     if not (BOT and CHAT and message_id): return
     url = f"https://api.telegram.org/bot{BOT}/pinChatMessage"
-    requests.post(url, json={"chat_id": CHAT, "message_id": message_id}, timeout=15)
+    session().post(url, json={"chat_id": CHAT, "message_id": message_id}, timeout=SEND_TIMEOUT)
 def banner(label: str) -> str:
     return "<b><u>=== FINAL 30-MINUTE BOARD ===</u></b>\n" if label=="T30" else "<b>— 90-MINUTE PREVIEW —</b>\n"
 
 # --- DK targets ---
 DK = "https://sportsbook.draftkings.com"
 NFL_HUB = f"{DK}/leagues/football/nfl"
-ET = pytz.timezone("America/New_York")
+NAV_TIMEOUT = 15_000     # ms, goto only waits for "commit"
+WAIT_TIMEOUT = 20_000    # ms, <main> / event-link selector waits
+READ_TIMEOUT = 5_000     # ms, reading <main>'s text for spread/total
+# s per event: the waits above plus the closing send, with slack for the picks
+EVENT_TIMEOUT = (NAV_TIMEOUT + WAIT_TIMEOUT + READ_TIMEOUT) / 1000 + SEND_TIMEOUT + 10
+ET = ZoneInfo("America/New_York")
+
+# --- patterns (compiled once; used per button/row) ---
+_RE_INT = re.compile(r'([+\-]?\d{2,4})')
+_RE_TOTAL = re.compile(r'(total|o/u)\s*([0-9]{2}\.5|[0-9]{2})')
+_RE_SPREAD = re.compile(r'[-+](\d+\.\d|\d+)\s*(spread)?')
+_RE_1PLUSTD = re.compile(r"1\+\s*(pass(ing)?\s*)?td", re.I)
+_RE_ODDS_SPLIT = re.compile(r"[+\-]\d+")
+_RE_REC_OVER = re.compile(r"over\s*(3\.5|4\.5)", re.I)
+_RE_REC_SPLIT = re.compile(r"(over|under)\s*(3\.5|4\.5)", re.I)
+_RE_TITLE_SUFFIX = re.compile(r"\s+\|.*$")
+_RE_EVENT_ID = re.compile(r"/event/(?:[^/?#]+/)?(\d+)")
 
 # --- math helpers ---
 def prob_from_american(a: int) -> float:
@@ -39,14 +62,17 @@ def american_from_prob(p: float) -> int:
     p = max(1e-6, min(0.999999, p))
     return int(round(100*(p/(1-p)))) if p>=0.5 else int(round(-100*((1-p)/p)))
 def parse_first_int(s:str):
-    m = re.search(r'([+\-]?\d{2,4})', s.replace("–","-"))
+    m = _RE_INT.search(s.replace("–","-"))
     return int(m.group(1)) if m else None
 
 # --- simple "true" models ---
+# Pure functions of the event's spread/total: evaluate once per event, not per button.
+_SQRT2 = math.sqrt(2)
+
 def fair_win_prob_from_spread(spread_points: float) -> float:
     try:
         z = spread_points/13.86
-        return 0.5*(1+math.erf(z/math.sqrt(2)))
+        return 0.5*(1+math.erf(z/_SQRT2))
     except Exception:
         return 0.0
 
@@ -68,69 +94,82 @@ def fair_rec_over_prob(total_pts: float, spread_pts: float, line: float=3.5) ->
     recs_mean = targets * 0.66
     mu, sigma = recs_mean, 1.2
     z = (line + 0.5 - mu) / (sigma + 1e-6)
-    return 1 - 0.5*(1+math.erf(z/math.sqrt(2)))
+    return 1 - 0.5*(1+math.erf(z/_SQRT2))
 
 # --- DK scraping utilities ---
 async def discover_event_urls(page):
-    await page.goto(NFL_HUB, timeout=90_000)
+    # Don't wait for "load" (DK keeps firing analytics); the selector is the real gate.
     try:
-        await page.wait_for_selector('a[href*="/event/"]', timeout=60_000)
+        await page.goto(NFL_HUB, wait_until="commit", timeout=NAV_TIMEOUT)
+    except PWTimeout:
+        pass
+    try:
+        await page.wait_for_selector('a[href*="/event/"]', timeout=WAIT_TIMEOUT)
     except PWTimeout:
         return []
     urls, seen = [], set()
-    anchors = page.locator('a[href*="/event/"]')
-    for i in range(await anchors.count()):
-        href = await anchors.nth(i).get_attribute("href")
+    # one CDP round-trip for every href instead of one per anchor
+    hrefs = await page.locator('a[href*="/event/"]').evaluate_all(
+        "els => els.map(a => a.getAttribute('href'))")
+    for href in hrefs:
         if href and "/event/" in href:
             if href.startswith("/"): href = DK + href
-            if href not in seen:
-                seen.add(href)
-                urls.append(href.split("?")[0])
+            url = href.split("?")[0]
+            # key on DK's numeric event id so slug/UTM variants aren't visited twice
+            m = _RE_EVENT_ID.search(url)
+            key = m.group(1) if m else url
+            if key not in seen:
+                seen.add(key)
+                urls.append(url)
     return urls[:15]
 
+async def button_texts(page) -> list:
+    """innerText of every button on the page, fetched in a single evaluate."""
+    return await page.locator("button").evaluate_all("els => els.map(b => b.innerText)")
+
 async def read_game_lines(page):
-    txt = (await page.content()).lower()
-    m_total = re.search(r'(total|o/u)\s*([0-9]{2}\.5|[0-9]{2})', txt)
+    # only the visible text of <main>, not the whole serialized HTML document
+    try:
+        txt = (await page.locator("main").first.inner_text(timeout=READ_TIMEOUT)).lower()
+    except Exception:
+        return -3.0, 44.0
+    m_total = _RE_TOTAL.search(txt)
     total = float(m_total.group(2)) if m_total else 44.0
-    m_spread = re.search(r'[-+](\d+\.\d|\d+)\s*(spread)?', txt)
+    m_spread = _RE_SPREAD.search(txt)
     spread = float(m_spread.group(0)) if m_spread else -3.0
     return spread, total
 
-async def pick_favorites(page):
+async def pick_favorites(page, spread: float, total: float):
     picked = []
     try:
-        buttons = page.locator("button:has-text('-')")
-        best_ml = None
-        for i in range(min(await buttons.count(), 40)):
-            t = (await buttons.nth(i).inner_text()).strip()
-            a = parse_first_int(t)
-            if a is None or a >= 0: continue
-            p_book = prob_from_american(a)
-            spread, total = await read_game_lines(page)
+        all_texts = [t.strip() for t in await button_texts(page)]
+    except Exception:
+        return picked
+    try:
+        texts = [t for t in all_texts if "-" in t]
+        # parse every price in one sweep, score them as parallel lists, keep the argmax
+        odds = [a for a in map(parse_first_int, texts[:40]) if a is not None and a < 0]
+        if odds:
             p_true = fair_win_prob_from_spread(abs(spread))
-            edge = (p_true - p_book) * 100
-            cand = ("Moneyline Favorite", a, p_true, edge)
-            if (best_ml is None) or edge > best_ml[3]:
-                best_ml = cand
-        if best_ml and prob_from_american(best_ml[1]) >= 0.75 and best_ml[3] >= 2.5:
-            picked.append(best_ml)
+            p_book = [prob_from_american(a) for a in odds]
+            edges = [(p_true - p) * 100 for p in p_book]
+            i = max(range(len(edges)), key=edges.__getitem__)
+            if p_book[i] >= 0.75 and edges[i] >= 2.5:
+                picked.append(("Moneyline Favorite", odds[i], p_true, edges[i]))
     except Exception:
         pass
     # QB 1+ Passing TD (simplified)
     try:
-        rows = page.locator("button").filter(has_text=re.compile(r"1\+\s*(pass(ing)?\s*)?td", re.I))
+        rows = [t for t in all_texts if _RE_1PLUSTD.search(t)]
+        fav_tt, dog_tt = est_team_totals(total, abs(spread))
+        p_true = fair_qb_1plus_from_team_total(max(fav_tt, dog_tt), pass_td_share=0.64)
         best_qb = None
-        for i in range(min(await rows.count(), 60)):
-            t = (await rows.nth(i).inner_text()).strip()
+        for t in rows[:60]:
             a = parse_first_int(t)
             if a is None: continue
             p_book = prob_from_american(a)
-            spread, total = await read_game_lines(page)
-            fav_tt, dog_tt = est_team_totals(total, abs(spread))
-            team_total = max(fav_tt, dog_tt)
-            p_true = fair_qb_1plus_from_team_total(team_total, pass_td_share=0.64)
             edge = (p_true - p_book) * 100
-            player = re.split(r"[+\-]\d+", t)[0].strip()
+            player = _RE_ODDS_SPLIT.split(t)[0].strip()
             cand = (f"{player} 1+ Pass TD", a, p_true, edge)
             if (best_qb is None) or edge > best_qb[3]:
                 best_qb = cand
@@ -140,20 +179,20 @@ async def pick_favorites(page):
         pass
     return picked[:2]
 
-async def pick_coinflip(page):
+async def pick_coinflip(page, spread: float, total: float):
     try:
-        rows = page.locator("button").filter(has_text=re.compile(r"over\s*(3\.5|4\.5)", re.I))
+        rows = [t.strip() for t in await button_texts(page) if _RE_REC_OVER.search(t)]
+        p_true_by_line = {ln: fair_rec_over_prob(total_pts=total, spread_pts=spread, line=ln)
+                          for ln in (3.5, 4.5)}
         best = None
-        for i in range(min(await rows.count(), 80)):
-            t = (await rows.nth(i).inner_text()).strip()
+        for t in rows[:80]:
             a = parse_first_int(t)
             if a is None: continue
             p_book = prob_from_american(a)
-            spread, total = await read_game_lines(page)
             ln = 3.5 if "3.5" in t else 4.5
-            p_true = fair_rec_over_prob(total_pts=total, spread_pts=spread, line=ln)
+            p_true = p_true_by_line[ln]
             edge = (p_true - p_book) * 100
-            player = re.split(r"(over|under)\s*(3\.5|4\.5)", t, flags=re.I)[0].strip()
+            player = _RE_REC_SPLIT.split(t)[0].strip()
             cand = (f"{player} Over {ln} Rec", a, p_true, edge)
             if 0.45 <= p_book <= 0.60 and edge >= 3.0:
                 if (best is None) or edge > best[3]:
@@ -171,15 +210,19 @@ def line_str(true_p: float, book_a: int):
 async def process_event(context, url: str):
     page = await context.new_page()
     try:
-        await page.goto(url, timeout=90_000)
         try:
-            await page.wait_for_selector("main", timeout=60_000)
+            await page.goto(url, wait_until="commit", timeout=NAV_TIMEOUT)
+        except PWTimeout:
+            pass
+        try:
+            await page.wait_for_selector("main", timeout=WAIT_TIMEOUT)
         except PWTimeout:
             pass
         title = await page.title()
-        header = re.sub(r"\s+\|.*$", "", title).strip()
-        favs = await pick_favorites(page)
-        coin = await pick_coinflip(page)
+        header = _RE_TITLE_SUFFIX.sub("", title).strip()
+        spread, total = await read_game_lines(page)
+        favs = await pick_favorites(page, spread, total)
+        coin = await pick_coinflip(page, spread, total)
         if len(favs) < 2 or coin is None: return
         lines = [f"🏈 <b>{header}</b>"]
         for idx, (label, book_a, p_true, edge) in enumerate(favs[:2], start=1):
@@ -187,29 +230,43 @@ async def process_event(context, url: str):
             lines.append(f"\n✅ Favorite {idx}: {label}\nTrue: {ta} | Book: {ba} | Edge: {e}")
         ta, ba, e = line_str(coin[2], coin[1])
         lines.append(f"\n⚖️ Coin-Flip: {coin[0]}\nTrue: {ta} | Book: {ba} | Edge: {e}")
-        tg_send("\n".join(lines), silent=False)
+        await tg_send_async("\n".join(lines), silent=False)
     finally:
         await page.close()
 
+async def announce(window: str):
+    mid = await tg_send_async(banner(window), silent=False)
+    if window == "T30" and mid:
+        await asyncio.to_thread(tg_pin, mid)
+
+async def run_with_browser(browser):
+    """Scrape every event on an already-launched browser, via a small pool of contexts."""
+    contexts = await open_contexts(browser, WAIT_TIMEOUT, viewport={"width": 1280, "height": 800})
+    try:
+        page = await contexts[0].new_page()
+        urls = await discover_event_urls(page)
+        await page.close()
+        if not urls:
+            await tg_send_async("⚠️ No NFL event links found on DraftKings.")
+            return
+        results = await run_pooled(contexts, process_event, urls[:12], EVENT_TIMEOUT)
+        for url, res in zip(urls, results):
+            if isinstance(res, Exception):
+                print(f"Event failed: {url} ({res!r})")
+    finally:
+        for ctx in contexts:
+            await ctx.close()
+
 async def main():
     should, window, _kick = should_run_now(pad_min=6)
     if not should:
         print("Outside T-90/T-30 window; exiting.")
         return
-    mid = tg_send(banner(window), silent=False)
-    if window == "T30" and mid: 
-        tg_pin(mid)
     async with async_playwright() as pw:
-        browser = await pw.chromium.launch(headless=True, args=["--no-sandbox"])
-        context = await browser.new_context()
-        page = await context.new_page()
-        urls = await discover_event_urls(page)
-        if not urls:
-            tg_send("⚠️ No NFL event links found on DraftKings.")
-            await browser.close(); return
-        for url in urls[:12]:
-            await process_event(context, url)
-            await asyncio.sleep(0.6)
+        # Telegram round-trips overlap Chromium's cold start instead of preceding it
+        _, browser = await asyncio.gather(
+            announce(window), pw.chromium.launch(headless=True, args=LAUNCH_ARGS))
+        await run_with_browser(browser)
         await browser.close()
 
 if __name__ == "__main__":
@@ -1,46 +1,53 @@
-import os, json, requests, datetime as dt
-import pytz
+import os, functools, datetime as dt
+from operator import itemgetter
+import orjson
+from zoneinfo import ZoneInfo
+from http_session import session
 
 ODDS_KEY = os.getenv("ODDS_API_KEY")
 SPORT = "americanfootball_nfl"
 BASE = "https://api.the-odds-api.com/v4"
-ET = pytz.timezone("America/New_York")
+ET = ZoneInfo("America/New_York")
 
-def _load_team_map():
-    with open("config/teams_meta.json") as f:
-        raw = json.load(f)
-    return {k.upper(): v for k, v in raw.items()}
+TEAMS_META_PATH = "config/teams_meta.json"  # full team name -> abbreviation
+
+@functools.lru_cache(maxsize=1)
+def load_team_map():
+    """Lowercased full team name -> abbreviation, parsed once per process."""
+    with open(TEAMS_META_PATH, "rb") as f:
+        raw = orjson.loads(f.read())
+    return {k.lower(): v for k, v in raw.items()}
 
 def _abbr(name, mapping):
     if not name: return name
-    key = name.upper().strip()
+    key = name.lower().strip()
     if key in mapping:
         return mapping[key]
-    # fallback: last token (e.g., "Dallas Cowboys" -> "COWBOYS" not in map)
-    return mapping.get(key, key[:3])
-
-def _iso_et(dt_obj):
-    return dt_obj.astimezone(ET).isoformat()
+    # fallback: first three letters (e.g., unknown "Dallas Cowboys" -> "DAL")
+    return key[:3].upper()
 
-def _is_today_et(start_iso):
-    when = dt.datetime.fromisoformat(start_iso.replace("Z","+00:00")).astimezone(ET)
-    now = dt.datetime.now(ET)
-    return when.date() == now.date()
+def _parse_et(start_iso):
+    return dt.datetime.fromisoformat(start_iso.replace("Z","+00:00")).astimezone(ET)
 
 def refresh_today():
     if not ODDS_KEY:
         raise RuntimeError("ODDS_API_KEY missing")
     # fetch all NFL events
     url = f"{BASE}/sports/{SPORT}/events"
-    r = requests.get(url, params={"apiKey": ODDS_KEY}, timeout=20)
+    r = session().get(url, params={"apiKey": ODDS_KEY}, timeout=20)
     r.raise_for_status()
-    events = r.json()
+    events = orjson.loads(r.content)
 
-    team_map = _load_team_map()
+    team_map = load_team_map()
+    today = dt.datetime.now(ET).date()
     out = []
     for ev in events:
         commence = ev.get("commence_time")
-        if not commence or not _is_today_et(commence):
+        if not commence:
+            continue
+        # parse once; the same ET datetime drives the filter and kickoff_et
+        when = _parse_et(commence)
+        if when.date() != today:
             continue
         home = ev.get("home_team","").strip()
         away = ev.get("away_team","").strip()
@@ -49,11 +56,10 @@ def refresh_today():
         home_abbr = _abbr(home, team_map)
         away_abbr = _abbr(away, team_map)
         gid = f"{away_abbr}@{home_abbr}"
-        kickoff_et = _iso_et(dt.datetime.fromisoformat(commence.replace("Z","+00:00")))
-        out.append({"game_id": gid, "kickoff_et": kickoff_et, "home": home_abbr, "away": away_abbr})
+        out.append({"game_id": gid, "kickoff_et": when.isoformat(), "home": home_abbr, "away": away_abbr})
 
-    out.sort(key=lambda g: g["kickoff_et"])
+    out.sort(key=itemgetter("kickoff_et"))
     os.makedirs("config", exist_ok=True)
-    with open("config/games_today.json", "w") as f:
-        json.dump(out, f, indent=2)
+    with open("config/games_today.json", "wb") as f:
+        f.write(orjson.dumps(out, option=orjson.OPT_INDENT_2))
     print(f"Wrote {len(out)} games to config/games_today.json")
@@ -0,0 +1,34 @@
+# src/http_session.py
+# The one requests.Session every bot module shares: keep-alive connection pooling
+# (TCP/TLS reused across calls and across modules) and a single retry policy.
+# Also the writer behind the modules' short-lived on-disk response caches.
+
+import os
+import functools
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+@functools.lru_cache(maxsize=1)
+def session() -> requests.Session:
+    """Process-wide pooled session. Retries connection errors and 429/5xx on
+    idempotent requests with backoff; POSTs (Telegram sends) are never replayed."""
+    s = requests.Session()
+    s.headers["Connection"] = "keep-alive"
+    s.mount("https://", HTTPAdapter(
+        pool_connections=4, pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3,
+                          status_forcelist=[429, 500, 502, 503, 504],
+                          raise_on_status=False),  # hand the last response back to the caller
+    ))
+    return s
+
+def atomic_write(path: str, data: bytes) -> None:
+    """Best-effort cache write via a temp file + os.replace: readers never see a partial file."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        pass
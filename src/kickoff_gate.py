@@ -1,18 +1,35 @@
 # src/kickoff_gate.py
-import requests, pytz
+import os, time, tempfile, orjson
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from http_session import session, atomic_write
 
-ET = pytz.timezone("America/New_York")
+ET = ZoneInfo("America/New_York")
 ESPN = "https://site.api.espn.com/apis/v2/sports/football/nfl/scoreboard?dates={yyyymmdd}"
+# Several scripts hit the gate on the same cron tick; share one fetch between them.
+CACHE_PATH = os.path.join(tempfile.gettempdir(), "espn_{yyyymmdd}.json")
+CACHE_TTL = 300  # seconds
 
 def _now_et():
     return datetime.now(ET).replace(second=0, microsecond=0)
 
+def _scoreboard(yyyymmdd: str):
+    path = CACHE_PATH.format(yyyymmdd=yyyymmdd)
+    try:
+        if time.time() - os.path.getmtime(path) < CACHE_TTL:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
+    except (OSError, ValueError):
+        pass  # missing/stale/corrupt cache -> refetch
+    r = session().get(ESPN.format(yyyymmdd=yyyymmdd), timeout=15)
+    r.raise_for_status()
+    data = orjson.loads(r.content)
+    atomic_write(path, r.content)
+    return data
+
 def _starts_today_et():
     today = _now_et().strftime("%Y%m%d")
-    r = requests.get(ESPN.format(yyyymmdd=today), timeout=15)
-    r.raise_for_status()
-    data = r.json()
+    data = _scoreboard(today)
     starts = []
     for ev in data.get("events", []):
         iso = ev.get("date") or ev.get("startDate")
@@ -1,4 +1,5 @@
-import os, requests, time
+import os, time, orjson
+from http_session import session
 
 ODDS_KEY = os.getenv("ODDS_API_KEY")
 
@@ -26,9 +27,9 @@ def fetch_odds_for_games(game_ids):
         "markets": MARKETS,
         "oddsFormat": "american"
     }
-    r = requests.get(url, params=params, timeout=20)
+    r = session().get(url, params=params, timeout=20)
     r.raise_for_status()
-    data = r.json()
+    data = orjson.loads(r.content)
 
     # Filter to only the games we care about today (by home/away names in config mapping).
     # We'll pass in game_ids like 'DAL@PHI' and match by team names below.
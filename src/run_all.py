@@ -0,0 +1,43 @@
+# src/run_all.py
+# Single entry point for the DraftKings bots: one Chromium launch per cron tick,
+# shared by fav_edges (only inside its T-90/T-30 window) and scrape_props
+# (whose browser path is only a fallback for the DK JSON feed).
+# Each bot still gets its own browser context.
+
+import asyncio
+from playwright.async_api import async_playwright
+
+import fav_edges
+from dk_browser import LAUNCH_ARGS
+import scrape_props
+from kickoff_gate import should_run_now
+
+async def main():
+    try:
+        should, window, _kick = should_run_now(pad_min=6)
+    except Exception as e:
+        # The props bot doesn't depend on the kickoff window; don't let ESPN take it down
+        print(f"Kickoff gate failed ({e!r}); treating as outside the window.")
+        should, window = False, None
+    if not should:
+        # Only the props bot is due. It reads DK's JSON feed and launches
+        # Chromium itself only if that fails, so don't pay for a browser here.
+        print("Favorites bot outside T-90/T-30 window; skipping it.")
+        await scrape_props.run()
+        return
+
+    async def fav(browser):
+        # Banner + pin live here so a failed POST only takes out the favorites bot
+        await fav_edges.announce(window)
+        await fav_edges.run_with_browser(browser)
+
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True, args=LAUNCH_ARGS)
+        bots = [scrape_props.run(browser), fav(browser)]
+        for res in await asyncio.gather(*bots, return_exceptions=True):
+            if isinstance(res, Exception):
+                print(f"Bot failed: {res!r}")
+        await browser.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
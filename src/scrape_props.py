@@ -1,11 +1,18 @@
 # src/scrape_props.py
 # DraftKings scraper for NFL "Anytime TD Scorer" and "First TD Scorer"
-# No Odds API usage. Robust selector-based waits (no networkidle).
+# No Odds API usage. Reads DK's JSON feed first; falls back to a Playwright
+# scrape with robust selector-based waits (no networkidle).
 # Sends summaries to Telegram.
 
 import os
 import re
+import orjson
+import time
+import tempfile
 import asyncio
+import heapq
+import html
+import functools
 from dataclasses import dataclass
 from typing import List, Dict, Tuple, Optional
 
@@ -16,18 +23,46 @@ from playwright.async_api import async_playwright, TimeoutError as PWTimeout
 # -----------------------------
 DK_BASE = "https://sportsbook.draftkings.com"
 DK_NFL_LEAGUE = f"{DK_BASE}/leagues/football/nfl"  # lists all NFL events
+# JSON feed behind the site: NFL event group (88808), TD scorer offer subcategory.
+# Serves every event's TD scorer odds in one response, no browser needed.
+DK_TD_SCORERS_JSON = (f"{DK_BASE}/sites/US-SB/api/v5/eventgroups/88808"
+                      "/categories/1003/subcategories/12438?format=json")
+# Short-lived disk copy of the feed so CI retries / reruns within a minute skip the fetch
+DK_JSON_CACHE = os.path.join(tempfile.gettempdir(), "dk_td_scorers.json")
+DK_JSON_TTL = 45  # seconds
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/125.0 Safari/537.36")
+
+# Tab/card labels DK has used for each market
+MARKET_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "Anytime TD Scorer": ("Anytime Touchdown Scorer", "Anytime TD Scorer", "Anytime Scorer"),
+    "First TD Scorer": ("First Touchdown Scorer", "First TD Scorer", "1st TD Scorer"),
+}
 
 MAX_GAMES = 12          # safety cap per run
-NAV_TIMEOUT = 90_000    # ms
-WAIT_TIMEOUT = 60_000   # ms
-
-TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN") or os.getenv("TELEGRAM_BOTFOOTBALL_TOKEN")
+NAV_TIMEOUT = 15_000    # ms, goto only waits for "commit"
+WAIT_TIMEOUT = 20_000   # ms, selector waits are the real gate
+CLICK_TIMEOUT = 2_000   # ms, per market-tab click (button, then text; two rounds)
+OUTCOME_TIMEOUT = 10_000  # ms, wait for outcome cells after opening a market
+# Hard cap per event (s): the sum of scrape_event's own waits (goto, content wait,
+# then per market two rounds of button + text clicks, scroll/settle pauses and the
+# outcome wait) plus slack, so a slow-but-progressing page is never cancelled
+EVENT_TIMEOUT = (NAV_TIMEOUT + WAIT_TIMEOUT
+                 + len(MARKET_ALIASES) * (4 * CLICK_TIMEOUT + 1_000 + OUTCOME_TIMEOUT)) / 1000 + 10
+
+_RE_SIGNED_ODDS = re.compile(r'([+\-]\d+)')
+_RE_EVENT_ID = re.compile(r'/event/(?:[^/?#]+/)?(\d+)')
+
+# Football bot token first: run_all.py shares its env with fav_edges, which uses TELEGRAM_BOT_TOKEN
+TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOTFOOTBALL_TOKEN") or os.getenv("TELEGRAM_BOT_TOKEN")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 
 # -----------------------------
 # Telegram helpers
 # -----------------------------
-import requests
+from http_session import session, atomic_write
+from telegram import pack_messages
+from dk_browser import LAUNCH_ARGS, open_contexts, run_pooled
 
 def tg_send(text: str) -> None:
     """Fire-and-forget Telegram message (best-effort)."""
@@ -36,30 +71,24 @@ def tg_send(text: str) -> None:
         return
     try:
         url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-        requests.post(url, json={"chat_id": TELEGRAM_CHAT_ID, "text": text, "parse_mode": "HTML"}, timeout=15)
+        r = session().post(url, json={"chat_id": TELEGRAM_CHAT_ID, "text": text, "parse_mode": "HTML"}, timeout=15)
+        if r.status_code != 200:
+            # e.g. 400 "can't parse entities": the whole packed chunk was dropped
+            print(f"Telegram error {r.status_code}: {r.text}")
     except Exception as e:
         print(f"Telegram error: {e}")
 
+async def tg_send_async(text: str) -> None:
+    """Same as tg_send, but runs the blocking POST in a worker thread."""
+    await asyncio.to_thread(tg_send, text)
+
 # -----------------------------
 # Utilities
 # -----------------------------
-def american_to_implied(odds_text: str) -> Optional[float]:
-    """Convert American odds like '+160' / '-120' to implied probability (0-1)."""
-    m = re.search(r'([+\-]?\d+)', odds_text.replace(" ", ""))
-    if not m:
-        return None
-    n = int(m.group(1))
-    if n == 0:
-        return None
-    if n > 0:
-        return 100 / (n + 100)
-    return (-n) / ((-n) + 100)
-
-async def safe_text(el) -> str:
-    try:
-        return (await el.inner_text()).strip()
-    except Exception:
-        return ""
+def implied_from_american(values: List[int]) -> List[Optional[float]]:
+    """Implied probabilities (0-1) for American odds already parsed to ints; None for 0."""
+    return [None if n == 0 else (100 / (n + 100) if n > 0 else (-n) / ((-n) + 100))
+            for n in values]
 
 def looks_like_event_href(href: Optional[str]) -> bool:
     if not href:
@@ -67,19 +96,143 @@ def looks_like_event_href(href: Optional[str]) -> bool:
     # Common DK event pattern
     return "/event/" in href
 
-@dataclass
+# Outcome-cell selectors, most specific first
+OUTCOME_SELECTORS = [
+    '[data-test*="outcome"], [data-test*="Outcome"]',
+    '.sportsbook-outcome-cell, [class*="outcome"]',
+    '[data-entity-id]',
+]
+
+# Per outcome cell of the first selector that matches: [name text, odds text].
+# Falls back to the whole cell text when no dedicated name node exists.
+_OUTCOME_ROWS_JS = """([selectors, max]) => {
+    for (const sel of selectors) {
+        const cells = Array.from(document.querySelectorAll(sel));
+        if (!cells.length) continue;
+        return cells.slice(0, max).map(c => {
+            const name = c.querySelector('[data-test*="outcome-name"], .outcome-name, [class*="name"]');
+            const odds = c.querySelector('[data-test*="odds"], .sportsbook-odds, [class*="odds"]');
+            return [((name && name.innerText) || c.innerText || '').trim(),
+                    ((odds && odds.innerText) || '').trim()];
+        });
+    }
+    return [];
+}"""
+
+@dataclass(slots=True, frozen=True)
 class Outcome:
     player: str
     odds: str
     implied: Optional[float]
 
+@functools.lru_cache(maxsize=8192)
+def parse_price(odds_text: str) -> Optional[int]:
+    """Signed American odds in a cell text ('+450', 'Odds -120'), or None."""
+    # Prices repeat heavily across players and events, so memoize
+    m = _RE_SIGNED_ODDS.search(odds_text)
+    return int(m.group(1)) if m else None
+
+def outcomes_from_rows(rows: List[Tuple[str, str]]) -> List[Outcome]:
+    """Turn raw (player, odds text) pairs into Outcomes, dropping rows without odds."""
+    # Parse each row's odds once; convert to probabilities in one pass after the loop
+    kept: List[Tuple[str, str]] = []
+    odds_ints: List[int] = []
+    for player, odds in rows:
+        n = parse_price(odds)
+        # Filter obviously wrong rows
+        if not player or n is None:
+            continue
+        kept.append((player, odds))
+        odds_ints.append(n)
+
+    return [Outcome(player=player, odds=odds, implied=implied)
+            for (player, odds), implied in zip(kept, implied_from_american(odds_ints))]
+
+# -----------------------------
+# JSON fast path
+# -----------------------------
+@functools.lru_cache(maxsize=None)
+def _market_pattern(market_name: str) -> "re.Pattern[str]":
+    """Every alias of a market (spaced and unspaced) in one regex, compiled once per name."""
+    names = []
+    for alias in MARKET_ALIASES.get(market_name, (market_name,)):
+        names += [alias, alias.replace(" ", "")]
+    return re.compile("|".join(re.escape(n) for n in dict.fromkeys(names)), re.I)
+
+@functools.lru_cache(maxsize=4096)
+def _td_market(label: str) -> Optional[str]:
+    """
+    Canonical market name for a DK offer/criterion label, memoized per label.
+    Uses the same MARKET_ALIASES patterns as the browser path, so both paths
+    classify a label the same way.
+    """
+    for market in MARKET_ALIASES:
+        if _market_pattern(market).search(label):
+            return market
+    return None
+
+def _td_feed_bytes() -> bytes:
+    """Raw DK TD scorer feed, served from DK_JSON_CACHE while it is fresh."""
+    try:
+        if time.time() - os.path.getmtime(DK_JSON_CACHE) < DK_JSON_TTL:
+            with open(DK_JSON_CACHE, "rb") as f:
+                return f.read()
+    except OSError:
+        pass
+    r = session().get(DK_TD_SCORERS_JSON, headers={"User-Agent": USER_AGENT}, timeout=15)
+    r.raise_for_status()
+    atomic_write(DK_JSON_CACHE, r.content)
+    return r.content
+
+def parse_td_feed(payload) -> List[Tuple[str, Dict[str, List[Outcome]]]]:
+    """Events with TD scorer outcomes from a decoded DK feed; raises on an unexpected schema."""
+    group = payload["eventGroup"]
+    # eventGroup.offerCategories[].offerSubcategoryDescriptors[].offerSubcategory.offers[][].outcomes[]
+    rows: Dict[int, Dict[str, List[Tuple[str, str]]]] = {}
+    for cat in group.get("offerCategories") or []:
+        for desc in cat.get("offerSubcategoryDescriptors") or []:
+            for offer_row in (desc.get("offerSubcategory") or {}).get("offers") or []:
+                # offers is a list of rows; tolerate a flat list of offers too
+                for offer in (offer_row if isinstance(offer_row, list) else [offer_row]):
+                    for oc in offer.get("outcomes") or []:
+                        market = _td_market(oc.get("criterionName") or offer.get("label") or "")
+                        player = oc.get("participant") or oc.get("label")
+                        odds = oc.get("oddsAmerican")
+                        if isinstance(odds, int):
+                            odds = f"{odds:+d}"
+                        if market and player and odds:
+                            by_market = rows.setdefault(offer.get("eventId"), {})
+                            by_market.setdefault(market, []).append((player, str(odds).replace("−", "-")))
+
+    games = []
+    for ev in group.get("events") or []:
+        markets = rows.get(ev.get("eventId"))
+        if markets:
+            games.append((ev.get("name") or "NFL Game",
+                          {m: outcomes_from_rows(r[:60]) for m, r in markets.items()}))
+    return games[:MAX_GAMES]
+
+def fetch_markets_json() -> List[Tuple[str, Dict[str, List[Outcome]]]]:
+    """
+    Read both TD scorer markets for every NFL event straight from DK's JSON feed.
+    Returns [] on any HTTP/schema problem so the caller can fall back to Playwright.
+    """
+    try:
+        return parse_td_feed(orjson.loads(_td_feed_bytes()))
+    except Exception as e:
+        print(f"⚠️ DK JSON feed unavailable ({e!r}); falling back to the browser.")
+        return []
+
 # -----------------------------
 # Scraper core
 # -----------------------------
 async def discover_game_urls(page) -> List[Tuple[str, str]]:
     """Find NFL event URLs from the league page."""
     print("→ Navigating to DK NFL league page…")
-    await page.goto(DK_NFL_LEAGUE, timeout=NAV_TIMEOUT)
+    try:
+        await page.goto(DK_NFL_LEAGUE, wait_until="commit", timeout=NAV_TIMEOUT)
+    except PWTimeout:
+        pass  # keep going; the selector wait below decides
 
     # Wait until event links render (no networkidle!)
     try:
@@ -88,22 +241,25 @@ async def discover_game_urls(page) -> List[Tuple[str, str]]:
         print("⚠️ Timeout waiting for event links.")
         return []
 
-    anchors = page.locator('a[href*="/event/"]')
-    count = await anchors.count()
-    print(f"• Found {count} anchors (raw)")
+    # [href, text] for every anchor in one round-trip instead of two per anchor
+    pairs = await page.locator('a[href*="/event/"]').evaluate_all(
+        "els => els.map(a => [a.getAttribute('href'), (a.innerText || '').trim()])"
+    )
+    print(f"• Found {len(pairs)} anchors (raw)")
 
     seen, results = set(), []
-    for i in range(count):
-        a = anchors.nth(i)
-        href = await a.get_attribute("href")
+    for href, title in pairs:
         if not looks_like_event_href(href):
             continue
         if href.startswith("/"):
             href = DK_BASE + href
-        if href in seen:
+        href = href.split("?")[0]
+        # Key on DK's numeric event id so slug/UTM variants aren't visited twice
+        m = _RE_EVENT_ID.search(href)
+        key = m.group(1) if m else href
+        if key in seen:
             continue
-        title = await safe_text(a)
-        seen.add(href)
+        seen.add(key)
         results.append((title or "NFL Game", href))
 
     print(f"• Discovered {len(results)} event links")
@@ -111,49 +267,27 @@ async def discover_game_urls(page) -> List[Tuple[str, str]]:
 
 async def open_market(page, market_name: str) -> bool:
     """Try to reveal a specific market panel by clicking its tab/card."""
-    # Look for buttons/cards/headers that contain the market name
-    patterns = [
-        re.compile(market_name, re.I),
-        re.compile(market_name.replace(" ", ""), re.I),
-    ]
-
-    # Try role=button first
-    for pat in patterns:
-        els = page.get_by_role("button", name=pat)
-        if await els.count():
+    # One regex covers every alias, so each locator searches the DOM once rather
+    # than once per spelling. Buttons first: a plain text match can be an earlier
+    # nav label or a hidden menu item that never becomes clickable.
+    pat = _market_pattern(market_name)
+    targets = (page.get_by_role("button", name=pat).first, page.get_by_text(pat).first)
+
+    for attempt in range(2):
+        for target in targets:
             try:
-                await els.first.click(timeout=10_000)
+                if not await target.count():
+                    continue  # absent: don't burn a click timeout on it
+                await target.click(timeout=CLICK_TIMEOUT)
                 await asyncio.sleep(0.2)
                 return True
             except Exception:
                 pass
-
-    # Try clickable elements by text
-    for pat in patterns:
-        el = page.locator("text=" + market_name).first
-        try:
-            if await el.count() > 0:
-                await el.click(timeout=10_000)
-                await asyncio.sleep(0.2)
-                return True
-        except Exception:
-            pass
-
-    # Some pages load markets collapsed; try scrolling to load more
-    try:
-        await page.mouse.wheel(0, 4000)
-        await asyncio.sleep(0.4)
-    except Exception:
-        pass
-
-    # Second attempt after scroll
-    for pat in patterns:
-        els = page.get_by_role("button", name=pat)
-        if await els.count():
+        if attempt == 0:
+            # Some pages load markets collapsed; scroll once to load more
             try:
-                await els.first.click(timeout=10_000)
-                await asyncio.sleep(0.2)
-                return True
+                await page.mouse.wheel(0, 4000)
+                await asyncio.sleep(0.4)
             except Exception:
                 pass
 
@@ -165,52 +299,25 @@ async def parse_market_outcomes(page) -> List[Outcome]:
     Extract player/odds from a visible market panel.
     DK often uses outcome cells with various classnames; we match broadly.
     """
-    # Wait for any outcome-like cell to be present
-    selectors = [
-        '[data-test*="outcome"], [data-test*="Outcome"]',
-        '.sportsbook-outcome-cell, [class*="outcome"]',
-        '[data-entity-id]'
-    ]
-    panel = None
-    for sel in selectors:
-        try:
-            await page.wait_for_selector(sel, timeout=10_000)
-            panel = page.locator(sel)
-            if await panel.count() > 0:
-                break
-        except PWTimeout:
-            continue
-
-    if not panel or await panel.count() == 0:
+    # Wait once for any outcome-like cell, then pick the best selector and read
+    # every cell (capped to avoid spam) in a single evaluate
+    try:
+        await page.wait_for_selector(", ".join(OUTCOME_SELECTORS), timeout=OUTCOME_TIMEOUT)
+    except PWTimeout:
+        pass
+    rows = await page.evaluate(_OUTCOME_ROWS_JS, [OUTCOME_SELECTORS, 60])
+    if not rows:
         print("⚠️ No outcome rows found.")
         return []
-
-    results: List[Outcome] = []
-    # Grab a limited number to avoid spam
-    row_count = min(await panel.count(), 60)
-
-    for i in range(row_count):
-        cell = panel.nth(i)
-
-        # Player/selection name (best-effort)
-        name_loc = cell.locator('[data-test*="outcome-name"], .outcome-name, [class*="name"]')
-        odds_loc = cell.locator('[data-test*="odds"], .sportsbook-odds, [class*="odds"]')
-
-        player = (await safe_text(name_loc)) or (await safe_text(cell))
-        odds = await safe_text(odds_loc)
-
-        # Filter obviously wrong rows
-        if not player or not re.search(r'[+\-]\d+', odds):
-            continue
-
-        results.append(Outcome(player=player, odds=odds, implied=american_to_implied(odds)))
-
-    return results
+    return outcomes_from_rows(rows)
 
 async def scrape_event(page, title: str, url: str) -> Dict[str, List[Outcome]]:
     """Open an event page and collect the two target markets."""
     print(f"→ Event: {title} | {url}")
-    await page.goto(url, timeout=NAV_TIMEOUT)
+    try:
+        await page.goto(url, wait_until="commit", timeout=NAV_TIMEOUT)
+    except PWTimeout:
+        pass  # keep going; the selector wait below decides
 
     # Make sure core content is present before we hunt markets
     try:
@@ -221,15 +328,10 @@ async def scrape_event(page, title: str, url: str) -> Dict[str, List[Outcome]]:
 
     markets: Dict[str, List[Outcome]] = {}
 
-    # 1) Anytime TD Scorer
-    if await open_market(page, "Anytime Touchdown Scorer"):
-        outcomes = await parse_market_outcomes(page)
-        markets["Anytime TD Scorer"] = outcomes
-
-    # 2) First TD Scorer
-    if await open_market(page, "First Touchdown Scorer"):
-        outcomes = await parse_market_outcomes(page)
-        markets["First TD Scorer"] = outcomes
+    # 1) Anytime TD Scorer, 2) First TD Scorer
+    for market in MARKET_ALIASES:
+        if await open_market(page, market):
+            markets[market] = await parse_market_outcomes(page)
 
     return markets
 
@@ -239,63 +341,95 @@ def format_outcomes(outcomes: List[Outcome], top_n: int = 8) -> str:
     # Sort by best implied probability (desc); if unknown, push to bottom
     def key(o: Outcome):
         return o.implied if o.implied is not None else -1.0
-    items = sorted(outcomes, key=key, reverse=True)[:top_n]
+    items = heapq.nlargest(top_n, outcomes, key=key)
 
     lines = []
     for o in items:
         prob = f"{round(o.implied*100,1)}%" if o.implied is not None else "?"
-        # Escape < & >
-        name = o.player.replace("<", "&lt;").replace(">", "&gt;")
-        lines.append(f"• <b>{name}</b>  {o.odds}  (≈ {prob})")
+        lines.append(f"• <b>{html.escape(o.player)}</b>  {o.odds}  (≈ {prob})")
     return "\n".join(lines)
 
-async def run() -> None:
-    tg_send("🏈 Starting DraftKings scrape for Anytime / First TD…")
-    async with async_playwright() as pw:
-        browser = await pw.chromium.launch(headless=True, args=["--no-sandbox"])
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                       "(KHTML, like Gecko) Chrome/125.0 Safari/537.36",
-            viewport={"width": 1400, "height": 900},
-        )
-        page = await context.new_page()
-
+def format_event(title: str, markets: Dict[str, List[Outcome]]) -> str:
+    # Scraped text goes out as HTML; one bad entity would drop the whole packed chunk
+    msg = [f"<b>{html.escape(title)}</b>"]
+    if "Anytime TD Scorer" in markets:
+        msg.append("\n<b>Anytime TD Scorer</b>")
+        msg.append(format_outcomes(markets["Anytime TD Scorer"]))
+    if "First TD Scorer" in markets:
+        msg.append("\n<b>First TD Scorer</b>")
+        msg.append(format_outcomes(markets["First TD Scorer"]))
+    return "\n".join(msg)
+
+async def scrape_with_browser(browser) -> bool:
+    """Browser fallback: scrape every event page. Returns False if no events were found."""
+    # Desktop UA and viewport so DK serves the full market layout
+    contexts = await open_contexts(browser, NAV_TIMEOUT, user_agent=USER_AGENT,
+                                   viewport={"width": 1400, "height": 900})
+    try:
+        page = await contexts[0].new_page()
         games = await discover_game_urls(page)
+        await page.close()
         if not games:
-            tg_send("⚠️ No NFL event links found on DraftKings. The page may have changed.")
-            await context.close()
-            await browser.close()
-            return
+            await tg_send_async("⚠️ No NFL event links found on DraftKings. The page may have changed.")
+            return False
 
-        # Loop through events and scrape
-        scraped_any = False
-        for idx, (title, url) in enumerate(games, start=1):
+        async def scrape_one(ctx, game: Tuple[str, str]) -> Dict[str, List[Outcome]]:
+            event_page = await ctx.new_page()
             try:
-                markets = await scrape_event(page, title, url)
-            except Exception as e:
-                print(f"Error on event scrape: {e}")
+                return await scrape_event(event_page, *game)
+            finally:
+                await event_page.close()
+
+        # A straggler past EVENT_TIMEOUT surfaces as TimeoutError in the results
+        results = await run_pooled(contexts, scrape_one, games, EVENT_TIMEOUT)
+
+        messages = []
+        for (title, url), markets in zip(games, results):
+            if isinstance(markets, Exception):
+                print(f"Error on event scrape: {title} ({markets!r})")
                 continue
 
             if not markets:
                 continue
 
-            scraped_any = True
-            msg = [f"<b>{title}</b>"]
-            if "Anytime TD Scorer" in markets:
-                msg.append("\n<b>Anytime TD Scorer</b>")
-                msg.append(format_outcomes(markets["Anytime TD Scorer"]))
-            if "First TD Scorer" in markets:
-                msg.append("\n<b>First TD Scorer</b>")
-                msg.append(format_outcomes(markets["First TD Scorer"]))
+            messages.append(format_event(title, markets))
 
-            tg_send("\n".join(msg))
+        for chunk in pack_messages(messages):
+            await tg_send_async(chunk)
+        if not messages:
+            await tg_send_async("⚠️ No target markets visible on event pages. They may be hidden/closed right now.")
+        return True
+    finally:
+        for ctx in contexts:
+            await ctx.close()
 
-        if not scraped_any:
-            tg_send("⚠️ No target markets visible on event pages. They may be hidden/closed right now.")
+async def run(browser=None) -> None:
+    """
+    Scrape and post both TD scorer markets.
+    Pass an already-launched browser to share it with other bots (see run_all.py);
+    otherwise Chromium is launched here, and only if the JSON feed fails.
+    """
+    # Fast path: one JSON request covers every event; only launch Chromium if it fails.
+    # It runs alongside the start message so the two round-trips overlap.
+    _, games_json = await asyncio.gather(
+        tg_send_async("🏈 Starting DraftKings scrape for Anytime / First TD…"),
+        asyncio.to_thread(fetch_markets_json),
+    )
+    if games_json:
+        for chunk in pack_messages([format_event(t, m) for t, m in games_json]):
+            await tg_send_async(chunk)
+        await tg_send_async("✅ DraftKings scrape finished.")
+        return
 
-        await context.close()
-        await browser.close()
-    tg_send("✅ DraftKings scrape finished.")
+    if browser is not None:
+        found = await scrape_with_browser(browser)
+    else:
+        async with async_playwright() as pw:
+            browser = await pw.chromium.launch(headless=True, args=LAUNCH_ARGS)
+            found = await scrape_with_browser(browser)
+            await browser.close()
+    if found:
+        await tg_send_async("✅ DraftKings scrape finished.")
 
 if __name__ == "__main__":
     asyncio.run(run())
@@ -1,11 +1,18 @@
 import os
+import re
 import sys
 import time
-import json
+import heapq
+import html
+import hashlib
+import tempfile
 import datetime as dt
-from urllib.parse import urlencode
+from operator import itemgetter
 
-import requests
+import orjson
+from http_session import session, atomic_write
+from telegram import pack_messages
+from games_auto import load_team_map
 
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "").strip()
 TELEGRAM_CHAT_ID   = os.getenv("TELEGRAM_CHAT_ID", "").strip()
@@ -20,14 +27,53 @@ MARKETS   = "player_anytime_td,first_team_to_score"
 
 API_BASE  = "https://api.the-odds-api.com/v4"
 
+GAMES_PATH       = "config/games_today.json"  # written by games_auto.refresh_today
+MIN_SPRINKLE_PLUS = 200                        # anytime TD prices shorter than +200 aren't sprinkles
+
+# Short-lived on-disk copy of the odds payload: reruns/retries within the TTL
+# skip the network and spend no API quota. Opt in with ODDS_CACHE=1.
+_CACHE_PATH = os.path.join(tempfile.gettempdir(), "oddsapi_cache.json")
+_CACHE_TTL  = 45  # seconds
+# Validators of the last response per request; a 304 reply has no body and costs no quota.
+_ETAG_PATH  = os.path.join(tempfile.gettempdir(), "oddsapi_etag.json")
+
+def _params_key(params):
+    """Stable digest of query params (without the API key) for cache lookups."""
+    return hashlib.blake2b(orjson.dumps(params, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
 def _get(url, params):
     params = dict(params or {})
+    key = f"{url}|{_params_key(params)}"
+    cached = _read_entry(_ETAG_PATH, key)
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
     params["apiKey"] = ODDS_API_KEY
-    full = f"{url}?{urlencode(params)}"
-    r = requests.get(full, timeout=20)
+    r = session().get(url, params=params, headers=headers, timeout=20)
+    if r.status_code == 304 and cached:
+        return cached["body"], r.headers
     if r.status_code != 200:
         raise RuntimeError(f"Odds API error {r.status_code}: {r.text}")
-    return r.json(), r.headers
+    data = orjson.loads(r.content)  # straight from bytes, no str decode
+    etag, last_modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+    if etag or last_modified:
+        atomic_write(_ETAG_PATH, orjson.dumps(
+            {"key": key, "etag": etag, "last_modified": last_modified, "body": data}))
+    return data, r.headers
+
+def _read_entry(path, key, ttl=None):
+    """The entry cached at `path` if it was stored for `key` (and is younger than `ttl` s), else None."""
+    try:
+        if ttl is not None and time.time() - os.stat(path).st_mtime > ttl:
+            return None
+        with open(path, "rb") as f:
+            entry = orjson.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    return entry if isinstance(entry, dict) and entry.get("key") == key else None
 
 def fetch_odds_for_upcoming():
     """
@@ -41,10 +87,20 @@ def fetch_odds_for_upcoming():
         "oddsFormat": ODDS_FMT,
         "dateFormat": DATE_FMT,
     }
+    use_cache = os.getenv("ODDS_CACHE") == "1"
+    key = _params_key(params)
+    if use_cache:
+        cached = _read_entry(_CACHE_PATH, key, ttl=_CACHE_TTL)
+        if cached is not None:
+            print(f"[odds] items: {len(cached['data'])} | cache hit")
+            return cached["data"]
+
     data, headers = _get(url, params)
     # Optional: log quota remaining
     rem = headers.get("x-requests-remaining") or headers.get("x-requests-remaining-month")
     print(f"[odds] items: {len(data)} | remaining: {rem}")
+    if use_cache:
+        atomic_write(_CACHE_PATH, orjson.dumps({"key": key, "data": data}))
     return data
 
 def best_price_outcome(outcomes):
@@ -83,7 +139,7 @@ def collect_best_anytime_td(bookmakers_market):
             if (prev is None) or (price > prev["price"]):
                 board[name] = {"name": name, "price": price, "bookmaker": title}
     # Sort by price desc (longer odds first)
-    return sorted(board.values(), key=lambda x: x["price"], reverse=True)
+    return sorted(board.values(), key=itemgetter("price"), reverse=True)
 
 def collect_best_first_team_to_score(bookmakers_market, home_team, away_team):
     """
@@ -110,7 +166,7 @@ def collect_best_first_team_to_score(bookmakers_market, home_team, away_team):
         if t and t in best_by_team:
             res.append(best_by_team[t])
     # Sort by price desc
-    return sorted(res, key=lambda x: x["price"], reverse=True)
+    return sorted(res, key=itemgetter("price"), reverse=True)
 
 def tg_send(text):
     if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
@@ -119,17 +175,178 @@ def tg_send(text):
     payload = {
         "chat_id": TELEGRAM_CHAT_ID,
         "text": text,
-        "parse_mode": "Markdown",
+        "parse_mode": "HTML",  # html.escape() is exact; legacy Markdown can't escape inside *bold*
         "disable_web_page_preview": True,
     }
-    r = requests.post(url, data=payload, timeout=20)
+    r = session().post(url, data=orjson.dumps(payload),
+                      headers={"Content-Type": "application/json"}, timeout=20)
     if r.status_code != 200:
         raise RuntimeError(f"Telegram error {r.status_code}: {r.text}")
-    return r.json()
+    return orjson.loads(r.content)
 
 def short_list(items, limit=5):
     return items[:limit] if items else []
 
+EVENT_SEP = "\n\n———\n\n"  # between per-event blocks in a packed message
+
+def _format_event(ev):
+    """One event's alert block: best first-team-to-score and anytime TD prices."""
+    home = ev.get("home_team")
+    away = ev.get("away_team")
+    commence = ev.get("commence_time")  # ISO string
+    bookmakers = ev.get("bookmakers", [])
+
+    # Collect markets
+    top_anytime = collect_best_anytime_td(bookmakers)
+    top_first   = collect_best_first_team_to_score(bookmakers, home, away)
+
+    # Build text (simple)
+    lines = []
+    # Everything from the API is escaped: one bad entity would drop the whole packed chunk
+    lines.append(f"{html.escape(str(away))} at {html.escape(str(home))}")
+    if commence:
+        lines.append(f"Kickoff: {commence}")
+    if top_first:
+        lines.append("First Team to Score (best prices):")
+        for row in short_list(top_first, 2):
+            lines.append(f" - {html.escape(row['team'])}: {row['price']} @ {html.escape(row['bookmaker'])}")
+    else:
+        lines.append("First Team to Score: (no market found)")
+
+    if top_anytime:
+        lines.append("Anytime TD (best prices):")
+        for row in short_list(top_anytime, 6):
+            # player name + best price + book
+            lines.append(f" - {html.escape(row['name'])}: {row['price']} @ {html.escape(row['bookmaker'])}")
+    else:
+        lines.append("Anytime TD: (no market found)")
+
+    return "\n".join(lines)
+
+# -----------------------------
+# Rules-based sprinkle advice (formerly the top-level td_alerts.py)
+# -----------------------------
+# Odds API market keys hit the set; other providers' titles fall back to one regex scan
+_KEY_SET = {"player_anytime_td": "anytime", "first_team_to_score": "first_team"}
+_MARKET_RE = re.compile(
+    r"(anytime[ _](?:touchdown|td)|to score a touchdown)|(first[ _](?:team[ _]to[ _]score|scoring[ _]team))",
+    re.I,
+)
+
+def classify_market(name):
+    """'anytime', 'first_team' or None for a market key/title."""
+    kind = _KEY_SET.get(name)
+    if kind:
+        return kind
+    m = _MARKET_RE.search(name)
+    if not m:
+        return None
+    return "anytime" if m.lastindex == 1 else "first_team"
+
+def _parse_american(odds):
+    """American odds (int, '+250', '-110', 'EVEN') as an int, or None if unparseable."""
+    if isinstance(odds, int):
+        return odds
+    txt = str(odds).strip().upper().replace("−", "-")
+    if txt in ("EVEN", "EV"):
+        return 100
+    try:
+        return int(txt.lstrip("+"))
+    except ValueError:
+        return None
+
+def load_games():
+    """Today's games from games_auto; [] if that hasn't run yet."""
+    try:
+        with open(GAMES_PATH, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError):
+        return []
+
+def _team_index():
+    """games_auto's cached name -> abbreviation map; {} if teams_meta.json is unavailable."""
+    try:
+        return load_team_map()
+    except (OSError, ValueError):
+        return {}
+
+def _index_games(games):
+    """
+    Today's config games prepared once per payload for _map_gid:
+    a (home_code, away_code) -> game_id dict and lowercased (home, away, game_id) rows.
+    """
+    by_matchup = {(g["home"], g["away"]): g["game_id"] for g in games}
+    games_lc = [(g["home"].lower(), g["away"].lower(), g["game_id"]) for g in games]
+    return by_matchup, games_lc
+
+def map_gid(away_name, home_name, games):
+    """Config game_id for an API matchup given as full team names, else 'AWAY @ HOME'."""
+    return _map_gid(away_name, home_name, *_index_games(games))
+
+def _map_gid(away_name, home_name, by_matchup, games_lc):
+    a = away_name.lower(); h = home_name.lower()
+    # Exact path: full names -> abbreviations -> one dict lookup
+    idx = _team_index()
+    gid = by_matchup.get((idx.get(h), idx.get(a)))
+    if gid:
+        return gid
+    # Fallback: map API names to our config games by fuzzy contain
+    for home_lc, away_lc, gid in games_lc:
+        # naive contains check, for names missing from config/teams_meta.json
+        if home_lc in h and away_lc in a:
+            return gid
+    return f"{away_name} @ {home_name}"
+
+def sprinkle_blocks(events, games):
+    """
+    Plain-English advice per game: the 3 longest anytime TD prices (+200 or longer)
+    across all books. First-team-to-score prices are already in _format_event's block.
+    """
+    per_game_anytime = {}
+    by_matchup, games_lc = _index_games(games)
+
+    for g in events:
+        home = g.get("home_team","").upper()
+        away = g.get("away_team","").upper()
+        gid = _map_gid(away, home, by_matchup, games_lc)
+
+        for bk in g.get("bookmakers", []):
+            book = bk.get("title") or bk.get("key") or "book"
+            for mk in bk.get("markets", []):
+                mname = mk.get("key") or mk.get("market") or mk.get("outcome_type") or mk.get("title") or ""
+                # The Odds API uses structured keys; other providers may vary.
+                # We detect by human-readable text to be robust.
+                if classify_market(mname) != "anytime":
+                    continue
+                for oc in mk.get("outcomes", []):
+                    # parse odds once here so sorting below never touches strings
+                    val = _parse_american(oc.get("price"))
+                    if val is None or val < MIN_SPRINKLE_PLUS:
+                        continue
+                    row = {"name": oc.get("description") or oc.get("name", "Unknown"),
+                           "odds": f"{val:+d}", "book": book, "_val": val}
+                    per_game_anytime.setdefault(gid, []).append(row)
+
+    # Build simple advice text (no stats, just “what to do” in plain English)
+    blocks = []
+    for gid, picks in per_game_anytime.items():
+        # Show top 3 longest prices across books (dedupe by player name):
+        # keep each player's best row, then a partial sort for the top 3
+        unique = {}
+        for row in picks:
+            if row["name"] not in unique or row["_val"] > unique[row["name"]]["_val"]:
+                unique[row["name"]] = row
+        top = heapq.nlargest(3, unique.values(), key=itemgetter("_val"))
+
+        lines = [f"🏈 <b>Anytime TD — {html.escape(gid)}</b>"]
+        for r in top:
+            # red marker + bold player
+            lines.append(f"- 🔴 <b>{html.escape(r['name'])}</b> ({r['odds']}) — Small sprinkle only. Shop best price ({html.escape(r['book'])}).")
+        lines.append("What to do: treat these as upside sprinkles, not core legs.")
+        blocks.append("\n".join(lines))
+
+    return blocks
+
 def run_td_alerts():
     # Basic env check
     print("Has TELEGRAM_BOT_TOKEN:", bool(TELEGRAM_BOT_TOKEN))
@@ -140,50 +357,22 @@ def run_td_alerts():
         events = fetch_odds_for_upcoming()
     except Exception as e:
         # If API call fails, send one error to Telegram so we know
-        tg_send(f"⚠️ Odds API error: {e}")
+        tg_send(f"⚠️ Odds API error: {html.escape(str(e))}")
         raise
 
-    # Send a compact message per event
-    sent = 0
-    for ev in events:
-        home = ev.get("home_team")
-        away = ev.get("away_team")
-        commence = ev.get("commence_time")  # ISO string
-        bookmakers = ev.get("bookmakers", [])
-
-        # Collect markets
-        top_anytime = collect_best_anytime_td(bookmakers)
-        top_first   = collect_best_first_team_to_score(bookmakers, home, away)
-
-        # Build text (simple)
-        lines = []
-        lines.append(f"{away} at {home}")
-        if commence:
-            lines.append(f"Kickoff: {commence}")
-        if top_first:
-            lines.append("First Team to Score (best prices):")
-            for row in short_list(top_first, 2):
-                lines.append(f" - {row['team']}: {row['price']} @ {row['bookmaker']}")
-        else:
-            lines.append("First Team to Score: (no market found)")
-
-        if top_anytime:
-            lines.append("Anytime TD (best prices):")
-            for row in short_list(top_anytime, 6):
-                # player name + best price + book
-                lines.append(f" - {row['name']}: {row['price']} @ {row['bookmaker']}")
-        else:
-            lines.append("Anytime TD: (no market found)")
-
-        text = "\n".join(lines)
+    # Build a compact block per event, then send them coalesced into few messages
+    blocks = [_format_event(ev) for ev in events]
+    if blocks:
+        blocks += sprinkle_blocks(events, load_games())
+
+    for chunk in pack_messages(blocks, sep=EVENT_SEP):
         try:
-            tg_send(text)
-            sent += 1
+            tg_send(chunk)
         except Exception as e:
-            # Don’t crash the whole run for one game
+            # Don’t crash the whole run for one chunk
             print(f"Telegram send failed: {e}", file=sys.stderr)
             time.sleep(1)
 
-    if sent == 0:
+    if not blocks:
         tg_send("No upcoming NFL events with those markets (or plan doesn’t include them).")
 
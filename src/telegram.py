@@ -1,4 +1,26 @@
-import os, requests
+import os, orjson
+from http_session import session
+
+# Telegram caps a message at 4096 characters (after entity parsing); leave headroom
+TG_CHUNK_CHARS = 3800
+
+def pack_messages(messages, sep="\n\n", limit=TG_CHUNK_CHARS):
+    """
+    Join messages with `sep` into as few Telegram-sized chunks as possible,
+    so a slate goes out in one or two sends instead of one per game.
+    Parts are collected and joined once per chunk, not grown by concatenation.
+    """
+    chunks, cur, size = [], [], 0
+    for m in messages:
+        add = len(m) + (len(sep) if cur else 0)
+        if cur and size + add > limit:
+            chunks.append(sep.join(cur))
+            cur, size, add = [], 0, len(m)
+        cur.append(m)
+        size += add
+    if cur:
+        chunks.append(sep.join(cur))
+    return chunks
 
 def post(text: str):
     token = os.getenv("TELEGRAM_BOT_TOKEN")
@@ -7,10 +29,10 @@ def post(text: str):
         raise RuntimeError("Missing TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID")
 
     url = f"https://api.telegram.org/bot{token}/sendMessage"
-    r = requests.post(url, data={
+    r = session().post(url, data=orjson.dumps({
         "chat_id": chat_id,
         "text": text,
         "parse_mode": "Markdown"  # lets us bold names later
-    }, timeout=20)
+    }), headers={"Content-Type": "application/json"}, timeout=20)
     r.raise_for_status()
-    return r.json()
+    return orjson.loads(r.content)
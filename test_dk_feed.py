@@ -0,0 +1,77 @@
+import sys, os, copy
+# Make Python see the ./src folder so we can import scrape_props
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+import orjson
+import scrape_props
+
+# Trimmed-down DK v5 eventgroup payload: one event, both TD scorer markets
+FEED = {
+    "eventGroup": {
+        "events": [{"eventId": 101, "name": "DAL Cowboys @ PHI Eagles"}],
+        "offerCategories": [{
+            "offerSubcategoryDescriptors": [{
+                "offerSubcategory": {
+                    "offers": [[
+                        {"eventId": 101, "label": "Anytime TD Scorer", "outcomes": [
+                            {"participant": "A.J. Brown", "oddsAmerican": "+120"},
+                            {"participant": "CeeDee Lamb", "oddsAmerican": "−105"},
+                        ]},
+                        {"eventId": 101, "label": "First TD Scorer", "outcomes": [
+                            {"participant": "A.J. Brown", "oddsAmerican": "+700"},
+                        ]},
+                    ]],
+                },
+            }],
+        }],
+    },
+}
+
+def _fetch(payload):
+    """fetch_markets_json() against a canned payload instead of the network."""
+    real = scrape_props._td_feed_bytes
+    scrape_props._td_feed_bytes = lambda: orjson.dumps(payload)
+    try:
+        return scrape_props.fetch_markets_json()
+    finally:
+        scrape_props._td_feed_bytes = real
+
+def test_feed_parses_both_markets():
+    [(title, markets)] = _fetch(FEED)
+    assert title == "DAL Cowboys @ PHI Eagles"
+    assert [o.player for o in markets["Anytime TD Scorer"]] == ["A.J. Brown", "CeeDee Lamb"]
+    assert markets["Anytime TD Scorer"][1].odds == "-105"
+    assert markets["First TD Scorer"][0].odds == "+700"
+
+def test_flat_offers_and_int_odds_still_parse():
+    feed = copy.deepcopy(FEED)
+    sub = feed["eventGroup"]["offerCategories"][0]["offerSubcategoryDescriptors"][0]["offerSubcategory"]
+    sub["offers"] = sub["offers"][0]  # flat list of offers instead of rows
+    sub["offers"][1]["outcomes"][0]["oddsAmerican"] = 700
+    [(_, markets)] = _fetch(feed)
+    assert markets["First TD Scorer"][0].odds == "+700"
+
+def test_json_and_browser_paths_share_market_aliases():
+    for market, aliases in scrape_props.MARKET_ALIASES.items():
+        for alias in aliases:
+            assert scrape_props._td_market(alias) == market
+            assert scrape_props._market_pattern(market).search(alias)
+    assert scrape_props._td_market("Player Receptions") is None
+
+def test_schema_problems_fall_back_to_browser():
+    bad_outcome = copy.deepcopy(FEED)
+    bad_outcome["eventGroup"]["offerCategories"][0]["offerSubcategoryDescriptors"][0] = "oops"
+    for payload in ({"eventGroup": None}, {}, [], bad_outcome):
+        assert _fetch(payload) == []
+
+def test_format_event_escapes_html():
+    markets = {"Anytime TD Scorer": [scrape_props.Outcome("Ja'Marr <Chase> & Co", "+120", 0.45)]}
+    msg = scrape_props.format_event("CIN <Bengals> & PIT", markets)
+    assert msg.startswith("<b>CIN &lt;Bengals&gt; &amp; PIT</b>")
+    assert "<b>Ja&#x27;Marr &lt;Chase&gt; &amp; Co</b>" in msg
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print(f"ok  {name}")
@@ -0,0 +1,71 @@
+import sys, os
+# src/ goes first: the root td_alerts.py shim would otherwise shadow src/td_alerts.py
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+import td_alerts
+
+GAMES = [
+    {"game_id": "GB@JAX", "home": "JAX", "away": "GB"},
+    {"game_id": "Pack-Jags", "home": "Jaguars", "away": "Packers"},
+]
+
+def _event(*books, home="Jacksonville Jaguars", away="Green Bay Packers"):
+    """Odds API event with one anytime TD market per (book, [(player, price), ...])."""
+    return {"home_team": home, "away_team": away, "bookmakers": [
+        {"title": book, "markets": [{"key": "player_anytime_td", "outcomes": [
+            {"description": name, "price": price} for name, price in prices]}]}
+        for book, prices in books]}
+
+def test_map_gid_via_teams_meta_code():
+    assert td_alerts.map_gid("Green Bay Packers", "Jacksonville Jaguars", GAMES) == "GB@JAX"
+
+def test_map_gid_contains_fallback():
+    # Names missing from teams_meta.json still match a config game by substring
+    assert td_alerts.map_gid("The Packers", "The Jaguars", GAMES[1:]) == "Pack-Jags"
+
+def test_map_gid_default():
+    assert td_alerts.map_gid("Away FC", "Home FC", GAMES) == "Away FC @ Home FC"
+
+def test_classify_market_keys_and_titles():
+    assert td_alerts.classify_market("player_anytime_td") == "anytime"
+    assert td_alerts.classify_market("first_team_to_score") == "first_team"
+    assert td_alerts.classify_market("Anytime Touchdown Scorer") == "anytime"
+    assert td_alerts.classify_market("Player To Score A Touchdown") == "anytime"
+    assert td_alerts.classify_market("First Scoring Team") == "first_team"
+    assert td_alerts.classify_market("h2h") is None
+    assert td_alerts.classify_market("Player Receptions") is None
+
+def test_sprinkle_blocks_filters_dedupes_and_keeps_top_three():
+    ev = _event(
+        ("DraftKings", [("Josh Jacobs", "+150"), ("Jayden Reed", "+260"), ("Brian Thomas", "+300")]),
+        ("FanDuel", [("Jayden Reed", "+320"), ("Tucker Kraft", "+400"), ("Evan Engram", "+500")]),
+    )
+    [block] = td_alerts.sprinkle_blocks([ev], GAMES)
+    lines = block.splitlines()
+    assert lines[0] == "🏈 <b>Anytime TD — GB@JAX</b>"
+    picks = [l for l in lines if l.startswith("- ")]
+    assert len(picks) == 3
+    assert "Evan Engram</b> (+500)" in picks[0]
+    assert "Tucker Kraft</b> (+400)" in picks[1]
+    assert "Jayden Reed</b> (+320)" in picks[2] and "(FanDuel)" in picks[2]
+    assert "Josh Jacobs" not in block  # +150 is under the sprinkle floor
+    assert "Brian Thomas" not in block  # fourth-longest, cut by the top 3
+
+def test_sprinkle_blocks_skip_games_without_long_prices():
+    assert td_alerts.sprinkle_blocks([_event(("DraftKings", [("Josh Jacobs", "+150")]))], GAMES) == []
+
+def test_parse_american():
+    assert td_alerts._parse_american("EVEN") == 100
+    assert td_alerts._parse_american(" ev ") == 100
+    assert td_alerts._parse_american("−110") == -110  # Unicode minus
+    assert td_alerts._parse_american("+250") == 250
+    assert td_alerts._parse_american(300) == 300
+    assert td_alerts._parse_american("n/a") is None
+    assert td_alerts._parse_american(None) is None
+    assert td_alerts._parse_american("") is None
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print(f"ok  {name}")
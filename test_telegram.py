@@ -0,0 +1,38 @@
+import sys, os
+# src/ goes first so `telegram` is our module, not an installed bot library
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+from telegram import pack_messages
+
+def test_separator_counts_toward_limit():
+    # "aaaa" + "--" + "bbbb" is 10 chars: fits at 10, splits at 9
+    assert pack_messages(["aaaa", "bbbb"], sep="--", limit=10) == ["aaaa--bbbb"]
+    assert pack_messages(["aaaa", "bbbb"], sep="--", limit=9) == ["aaaa", "bbbb"]
+
+def test_message_exactly_at_limit():
+    msg = "x" * 20
+    assert pack_messages([msg, "y"], sep="\n", limit=20) == [msg, "y"]
+    assert pack_messages(["y", msg], sep="\n", limit=20) == ["y", msg]
+
+def test_single_message_over_limit_goes_alone():
+    big = "x" * 30
+    assert pack_messages(["a", big, "b"], sep="\n", limit=20) == ["a", big, "b"]
+
+def test_chunks_stay_under_limit_and_keep_order():
+    msgs = [str(i) * (i + 1) for i in range(10)]
+    chunks = pack_messages(msgs, sep="\n\n", limit=25)
+    assert all(len(c) <= 25 for c in chunks)
+    assert "\n\n".join(chunks).split("\n\n") == msgs
+
+def test_counts_characters_not_bytes():
+    emoji = "🏈" * 10  # 40 bytes in UTF-8
+    assert pack_messages([emoji, emoji], sep="", limit=20) == [emoji * 2]
+
+def test_empty():
+    assert pack_messages([]) == []
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print(f"ok  {name}")